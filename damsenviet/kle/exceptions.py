@@ -1,6 +1,9 @@
+from __future__ import annotations
 from typing import (
     Any,
+    Optional,
     Union,
+    Tuple,
     List,
     Dict,
 )
@@ -11,9 +14,18 @@ __all__ = [
 ]
 
 
+Payload_JSON = Union[int, float, str, None, Dict, List]
+
+# released DeserializeExceptions available for reuse by acquire
+_exception_pool: List[DeserializeException] = []
+_exception_pool_size = 128
+
+
 class IllegalValueException(Exception):
     """Exceptions for encountering illegal values."""
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         message: str,
@@ -31,31 +43,129 @@ class IllegalValueException(Exception):
 class DeserializeException(Exception):
     """Exceptions encountered during deserialization."""
 
+    # store payload in a slot rather than a lazily created instance __dict__
+    __slots__ = ("payload", "_format_args")
+
+    payload: Payload_JSON
+    # None unless the message is a template deferred by lazy
+    _format_args: Optional[Tuple]
+
     def __init__(
         self,
         message: str,
-        payload: Union[
-            int,
-            float,
-            str,
-            None,
-            Dict,
-            List,
-        ],
+        payload: Payload_JSON,
     ):
         """Initializes a DeserializeException.
 
         :param message: the error message
         :type message: str
         :param payload: the offending json payload, defaults to None
-        :type payload: Union[ int, float, str, None, Dict, List, ], optional
+        :type payload: Union[int, float, str, None, Dict, List], optional
         """
         super().__init__(message)
-        self.payload: Union[
-            int,
-            float,
-            str,
-            None,
-            Dict,
-            List,
-        ] = payload
+        self.payload = payload
+        self._format_args = None
+
+    def _render(self) -> None:
+        # render a deferred message once, then keep the rendered form
+        if self._format_args is not None:
+            format_args = self._format_args
+            self._format_args = None
+            message_format = Exception.args.__get__(self)[0]
+            Exception.args.__set__(self, (message_format.format(*format_args),))
+
+    @property
+    def args(self) -> Tuple:
+        self._render()
+        return Exception.args.__get__(self)
+
+    @args.setter
+    def args(self, args: Tuple) -> None:
+        self._format_args = None
+        Exception.args.__set__(self, args)
+
+    def __str__(self) -> str:
+        self._render()
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        self._render()
+        return super().__repr__()
+
+    @classmethod
+    def lazy(
+        cls,
+        message_format: str,
+        *format_args: Any,
+        payload: Payload_JSON = None,
+    ) -> DeserializeException:
+        """Creates a DeserializeException with a deferred message.
+
+        The message is formatted the first time str, repr or args is used,
+        so callers never observe the unformatted template.
+
+        :param message_format: the error message as a str.format template
+        :type message_format: str
+        :param format_args: the values to format into the template
+        :type format_args: Any
+        :param payload: the offending json payload, defaults to None
+        :type payload: Union[int, float, str, None, Dict, List], optional
+        :return: the exception
+        :rtype: DeserializeException
+        """
+        exception = cls(message_format, payload)
+        exception._format_args = format_args
+        return exception
+
+    @classmethod
+    def acquire(
+        cls,
+        message: str,
+        payload: Payload_JSON = None,
+    ) -> DeserializeException:
+        """Gets a DeserializeException, reusing a released one if available.
+
+        Intended for callers that construct and discard many exceptions,
+        e.g. speculative parsing. Pair with release once handled.
+
+        :param message: the error message
+        :type message: str
+        :param payload: the offending json payload, defaults to None
+        :type payload: Union[int, float, str, None, Dict, List], optional
+        :return: the exception
+        :rtype: DeserializeException
+        """
+        if cls is not DeserializeException or not _exception_pool:
+            return cls(message, payload)
+        exception = _exception_pool.pop()
+        exception.args = (message,)
+        exception.payload = payload
+        return exception
+
+    @staticmethod
+    def release(exception: DeserializeException) -> None:
+        """Returns a handled DeserializeException for reuse by acquire.
+
+        The exception must not be referenced after being released.
+
+        :param exception: the handled exception
+        :type exception: DeserializeException
+        """
+        if type(exception) is not DeserializeException:
+            return
+        if len(_exception_pool) >= _exception_pool_size:
+            return
+        # releasing twice would hand the same instance to two acquirers
+        if exception in _exception_pool:
+            return
+        exception.__traceback__ = None
+        exception.__cause__ = None
+        exception.__context__ = None
+        exception.__suppress_context__ = False
+        # notes from add_note, checked first since deleting a missing
+        # attribute would still create an instance dict
+        if hasattr(exception, "__notes__"):
+            del exception.__notes__
+        exception.payload = None
+        exception._format_args = None
+        _exception_pool.append(exception)
@@ -2,15 +2,20 @@ from __future__ import annotations
 from typing import (
     Union,
     List,
+    Dict,
 )
+from copy import deepcopy
 from mpmath import mpf
 from typeguard import typechecked
 from .label import Label
 from .switch import Switch
 from .utils import (
     autorepr,
+    copy_fields,
     expect,
     is_valid_css_color,
+    _MPF_ZERO,
+    _MPF_ONE,
 )
 
 __all__ = ["Key"]
@@ -24,17 +29,17 @@ class Key:
         self.labels: List[Label] = [Label() for i in range(12)]
         self.default_text_color: str = "#000000"
         self.default_text_size: str = 3
-        self.x: mpf = mpf(str(0.0))
-        self.y: mpf = mpf(str(0.0))
-        self.width: mpf = mpf(str(1.0))
-        self.height: mpf = mpf(str(1.0))
-        self.x2: mpf = mpf(str(0.0))
-        self.y2: mpf = mpf(str(0.0))
-        self.width2: mpf = mpf(str(1.0))
-        self.height2: mpf = mpf(str(1.0))
-        self.rotation_x: mpf = mpf(str(0.0))
-        self.rotation_y: mpf = mpf(str(0.0))
-        self.rotation_angle: mpf = mpf(str(0.0))
+        self.x: mpf = _MPF_ZERO
+        self.y: mpf = _MPF_ZERO
+        self.width: mpf = _MPF_ONE
+        self.height: mpf = _MPF_ONE
+        self.x2: mpf = _MPF_ZERO
+        self.y2: mpf = _MPF_ZERO
+        self.width2: mpf = _MPF_ONE
+        self.height2: mpf = _MPF_ONE
+        self.rotation_x: mpf = _MPF_ZERO
+        self.rotation_y: mpf = _MPF_ZERO
+        self.rotation_angle: mpf = _MPF_ZERO
         self.is_ghosted: bool = False
         self.is_stepped: bool = False
         self.is_homing: bool = False
@@ -70,6 +75,13 @@ class Key:
         attributes["switch"] = self.switch
         return autorepr(self, attributes)
 
+    def __deepcopy__(self, memo: Dict) -> Key:
+        # labels and switch are the only mutable fields
+        key = copy_fields(self, memo)
+        key.__labels = [deepcopy(label, memo) for label in self.__labels]
+        key.__switch = deepcopy(self.__switch, memo)
+        return key
+
     @property
     def color(self) -> str:
         """Gets cap css color.
@@ -1,13 +1,19 @@
 from __future__ import annotations
 from typing import (
-    cast,
     Any,
     Union,
     Tuple,
     List,
     Dict,
+    Sequence,
 )
 from copy import deepcopy
+from functools import lru_cache
+from itertools import (
+    chain,
+    repeat,
+)
+from operator import attrgetter
 from mpmath import mpf
 from typeguard import typechecked
 from .metadata import Metadata
@@ -20,6 +26,9 @@ from .utils import (
     autorepr,
     with_precision,
     kle_precision,
+    _MPF_ZERO,
+    _MPF_ONE,
+    _MPF_360,
 )
 
 __all__ = ["Keyboard"]
@@ -27,6 +36,9 @@ __all__ = ["Keyboard"]
 
 Keyboard_JSON = List[Union[Dict, List[Union[str, Dict]]]]
 
+# shared all zero text sizes, lets unchanged sizes be compared by identity
+_ZERO_TEXT_SIZES = (0,) * 12
+
 # fmt: off
 label_map = [
     # -1 indicates not used
@@ -41,6 +53,12 @@ label_map = [
     [4, -1, -1, -1, 10, -1, -1, -1, -1, -1, -1, -1],
 ]
 
+# label_map inverted, the aligned position of each label, -1 if not used
+inverse_label_map = [
+    [positions.index(i) if i in positions else -1 for i in range(12)]
+    for positions in label_map
+]
+
 
 disallowed_alignnment_for_labels = [
     [1, 2, 3, 5, 6, 7],  # 0
@@ -58,8 +76,12 @@ disallowed_alignnment_for_labels = [
 ]
 # fmt: on
 
+# for constant time membership checks
+disallowed_alignment_sets_for_labels = [
+    frozenset(alignments) for alignments in disallowed_alignnment_for_labels
+]
+
 
-@typechecked
 def unaligned(aligned_items: List, alignment: int, default_val: Any) -> List:
     """Returns the unaligned ordering of aligned items.
 
@@ -70,46 +92,104 @@ def unaligned(aligned_items: List, alignment: int, default_val: Any) -> List:
     :return: The reordered items.
     :rtype: list
     """
-    unaligned_items = [default_val for i in range(12)]
+    positions = label_map[alignment]
+    unaligned_items = [default_val] * 12
     for i, aligned_item in enumerate(aligned_items):
-        unaligned_items[label_map[alignment][i]] = aligned_item
+        unaligned_items[positions[i]] = aligned_item
     return unaligned_items
 
 
-@typechecked
+def _to_mpf(value: Union[int, float]) -> mpf:
+    """Converts a json number to mpf.
+
+    Floats are parsed from their shortest repr so the binary error of the
+    float isn't carried into the mpf, ints are exact and passed directly.
+
+    :param value: the json number
+    :type value: Union[int, float]
+    :return: the number as mpf
+    :rtype: mpf
+    """
+    if type(value) is int:
+        return mpf(value)
+    return mpf(str(value))
+
+
+# json name -> Metadata attribute, for metadata directly copied over
+metadata_change_attributes = {
+    "author": "author",
+    "backcolor": "background_color",
+    "name": "name",
+    "notes": "notes",
+    "radii": "radii",
+    "css": "css",
+}
+
+
+# changes that can be played back in any order, after the ones that can't
+# json name -> (Key attribute, json value conversion or None)
+key_change_setters = {
+    "r": ("rotation_angle", _to_mpf),
+    "p": ("profile_and_row", None),
+    "c": ("color", None),
+    "x2": ("x2", _to_mpf),
+    "y2": ("y2", _to_mpf),
+    "w2": ("width2", _to_mpf),
+    "h2": ("height2", _to_mpf),
+    "n": ("is_homing", None),
+    "l": ("is_stepped", None),
+    "d": ("is_decal", None),
+    "g": ("is_ghosted", None),
+}
+
+
+# properties serialized against a fixed default rather than the previous key
+# (json name, Key attribute, default), a callable default is read off the key
+key_change_defaults = (
+    ("w", "width", _MPF_ONE),
+    ("h", "height", _MPF_ONE),
+    ("w2", "width2", attrgetter("width")),
+    ("h2", "height2", attrgetter("height")),
+    ("x2", "x2", _MPF_ZERO),
+    ("y2", "y2", _MPF_ZERO),
+    ("n", "is_homing", False),
+    ("l", "is_stepped", False),
+    ("d", "is_decal", False),
+)
+
+
 def compare_text_sizes(
-    text_sizes: Union[int, float, List[Union[int, float]]],
-    aligned_text_sizes: List[Union[int, float]],
+    text_sizes: Union[int, float, Sequence[Union[int, float]]],
+    aligned_text_sizes: Sequence[Union[int, float]],
     aligned_text_labels: List[str],
 ) -> bool:
     """Determines whether text sizes and ordered version are equal.
 
     :param text_sizes: the text sizes to compare
-    :type text_sizes: Union[int, List[int]]
+    :type text_sizes: Union[int, float, Sequence[Union[int, float]]]
     :param aligned_text_sizes: the ordered text sizes
-    :type algined_text_sizes: List[Union[int, float]]
+    :type algined_text_sizes: Sequence[Union[int, float]]
     :param aligned_text_labels: the ordered labels
     :type aligned_text_labels: List[str]
     :return: whether text sizes are equal
     :rtype: bool
     """
+    if text_sizes is aligned_text_sizes:
+        return True
     if type(text_sizes) is int or type(text_sizes) is float:
-        text_sizes = [text_sizes] + [0 for i in range(11)]
-    for i in range(12):
-        if aligned_text_labels[i] == "":
+        # a scalar is the first text size, the rest are 0
+        text_sizes = chain((text_sizes,), repeat(0))
+    for text_size, aligned_text_size, aligned_text_label in zip(
+        text_sizes, aligned_text_sizes, aligned_text_labels
+    ):
+        if aligned_text_label == "":
             continue
-
-        if (
-            # text size is non 0 and aligned text size is 0 or
-            # text is 0 and aligned text size is non 0
-            (bool(text_sizes[i]) != bool(aligned_text_sizes[i]))
-            or (text_sizes[i] != 0 and text_sizes[i] != aligned_text_sizes[i])
-        ):
+        # covers a 0 against a non 0 size either way, and unequal non 0 sizes
+        if text_size != aligned_text_size:
             return False
     return True
 
 
-@typechecked
 def playback_metadata_changes(metadata: Metadata, metadata_changes: Dict) -> None:
     """Playback the changes into the metadata.
 
@@ -120,29 +200,21 @@ def playback_metadata_changes(metadata: Metadata, metadata_changes: Dict) -> Non
     :return: the metadata
     :rtype: Metadata
     """
-    if "author" in metadata_changes:
-        metadata.author = metadata_changes["author"]
-    if "backcolor" in metadata_changes:
-        metadata.background_color = metadata_changes["backcolor"]
+    for name, value in metadata_changes.items():
+        if name in metadata_change_attributes:
+            setattr(metadata, metadata_change_attributes[name], value)
     if "background" in metadata_changes:
         if "name" in metadata_changes["background"]:
             metadata.background.name = metadata_changes["background"]["name"]
         if "style" in metadata_changes["background"]:
             metadata.background.style = metadata_changes["background"]["style"]
-    if "name" in metadata_changes:
-        metadata.name = metadata_changes["name"]
-    if "notes" in metadata_changes:
-        metadata.notes = metadata_changes["notes"]
-    if "radii" in metadata_changes:
-        metadata.radii = metadata_changes["radii"]
+    # mount resets brand and type, so it has to be played back first
     if "switchMount" in metadata_changes:
         metadata.switch.mount = metadata_changes["switchMount"]
     if "switchBrand" in metadata_changes:
         metadata.switch.brand = metadata_changes["switchBrand"]
     if "switchType" in metadata_changes:
         metadata.switch.type = metadata_changes["switchType"]
-    if "css" in metadata_changes:
-        metadata.css = metadata_changes["css"]
     if "pcb" in metadata_changes:
         metadata.is_switches_pcb_mounted = metadata_changes["pcb"]
         metadata.include_switches_pcb_mounted = True
@@ -151,7 +223,6 @@ def playback_metadata_changes(metadata: Metadata, metadata_changes: Dict) -> Non
         metadata.include_switches_plate_mounted = True
 
 
-@typechecked
 def playback_key_changes(
     key: Key,
     key_changes: Dict,
@@ -180,74 +251,58 @@ def playback_key_changes(
     :return: current_labels_color, current_labels_size, align, cluster_rotation_x, cluster_rotation_y
     :rtype: Tuple[List[str], List[Union[int, float]], int, mpf, mpf]
     """
-    if "r" in key_changes:
-        key.rotation_angle = mpf(str(key_changes["r"]))
     if "rx" in key_changes:
-        key.rotation_x = mpf(str(key_changes["rx"]))
-        cluster_rotation_x = mpf(str(key_changes["rx"]))
+        cluster_rotation_x = _to_mpf(key_changes["rx"])
+        key.rotation_x = cluster_rotation_x
         key.x = cluster_rotation_x
         key.y = cluster_rotation_y
     if "ry" in key_changes:
-        key.rotation_y = mpf(str(key_changes["ry"]))
-        cluster_rotation_y = mpf(str(key_changes["ry"]))
+        cluster_rotation_y = _to_mpf(key_changes["ry"])
+        key.rotation_y = cluster_rotation_y
         key.x = cluster_rotation_x
         key.y = cluster_rotation_y
     if "a" in key_changes:
         alignment = key_changes["a"]
     if "f" in key_changes:
         key.default_text_size = key_changes["f"]
-        for i in range(len([size for size in current_labels_size])):
-            current_labels_size[i] = 0
+        current_labels_size[:] = [0] * len(current_labels_size)
     if "f2" in key_changes:
-        for i in range(1, 12):
-            current_labels_size[i] = key_changes["f2"]
+        current_labels_size[1:12] = [key_changes["f2"]] * 11
     if "fa" in key_changes:
-        for i in range(len(key_changes["fa"])):
-            current_labels_size[i] = key_changes["fa"][i]
-        for i in range(len(key_changes["fa"]), 12):
-            current_labels_size[i] = 0
-    if "p" in key_changes:
-        key.profile_and_row = key_changes["p"]
-    if "c" in key_changes:
-        key.color = key_changes["c"]
+        labels_size = key_changes["fa"]
+        current_labels_size[: len(labels_size)] = labels_size
+        current_labels_size[len(labels_size) :] = [0] * (12 - len(labels_size))
     if "t" in key_changes:
-        labels_color = deepcopy(key_changes["t"]).split("\n")
+        labels_color = key_changes["t"].split("\n")
         if labels_color[0] != "":
             key.default_text_color = labels_color[0]
         for i, color in enumerate(unaligned(labels_color, alignment, "")):
             current_labels_color[i] = color
     if "x" in key_changes:
-        key.x = key.x + mpf(str(key_changes["x"]))
+        key.x = key.x + _to_mpf(key_changes["x"])
     if "y" in key_changes:
-        key.y = key.y + mpf(str(key_changes["y"]))
+        key.y = key.y + _to_mpf(key_changes["y"])
     if "w" in key_changes:
-        key.width = mpf(str(key_changes["w"]))
-        key.width2 = mpf(str(key_changes["w"]))
+        width = _to_mpf(key_changes["w"])
+        key.width = width
+        key.width2 = width
     if "h" in key_changes:
-        key.height = mpf(str(key_changes["h"]))
-        key.height2 = mpf(str(key_changes["h"]))
-    if "x2" in key_changes:
-        key.x2 = mpf(str(key_changes["x2"]))
-    if "y2" in key_changes:
-        key.y2 = mpf(str(key_changes["y2"]))
-    if "w2" in key_changes:
-        key.width2 = mpf(str(key_changes["w2"]))
-    if "h2" in key_changes:
-        key.height2 = mpf(str(key_changes["h2"]))
-    if "n" in key_changes:
-        key.is_homing = key_changes["n"]
-    if "l" in key_changes:
-        key.is_stepped = key_changes["l"]
-    if "d" in key_changes:
-        key.is_decal = key_changes["d"]
-    if "g" in key_changes:
-        key.is_ghosted = key_changes["g"]
+        height = _to_mpf(key_changes["h"])
+        key.height = height
+        key.height2 = height
+    # mount resets brand and type, so it has to be played back first
     if "sm" in key_changes:
         key.switch.mount = key_changes["sm"]
     if "sb" in key_changes:
-        key.switch.mount = key_changes["sb"]
+        key.switch.brand = key_changes["sb"]
     if "st" in key_changes:
-        key.switch.mount = key_changes["st"]
+        key.switch.type = key_changes["st"]
+    # remaining changes are independent, only visit the ones present
+    for name, value in key_changes.items():
+        if name not in key_change_setters:
+            continue
+        attribute, from_json = key_change_setters[name]
+        setattr(key, attribute, value if from_json is None else from_json(value))
     return (
         current_labels_color,
         current_labels_size,
@@ -257,27 +312,27 @@ def playback_key_changes(
     )
 
 
-@typechecked
 def key_sort_criteria(
     key: Key,
-) -> Tuple[mpf, mpf, mpf, mpf, mpf]:
+) -> Tuple[float, float, float, float, float]:
     """A helper to sort keys into the KLE order before serialization.
 
+    Floats are returned so the sort compares natively instead of through mpf.
+
     :param key: the key to compare
     :type key: Key
     :return: the multidimensional ordering for comparison
-    :rtype: Tuple[ mpf, mpf, mpf, mpf, mpf, ]
+    :rtype: Tuple[ float, float, float, float, float, ]
     """
     return (
-        (key.rotation_angle + 360) % 360,
-        key.rotation_x,
-        key.rotation_y,
-        key.y,
-        key.x,
+        float((key.rotation_angle + _MPF_360) % _MPF_360),
+        float(key.rotation_x),
+        float(key.rotation_y),
+        float(key.y),
+        float(key.x),
     )
 
 
-@typechecked
 def record_change(changes: Dict, name: str, val: T, default_val: S) -> T:
     """Registers the change if value is not equal to default.
 
@@ -294,8 +349,9 @@ def record_change(changes: Dict, name: str, val: T, default_val: S) -> T:
     """
     if val != default_val:
         if type(val) is mpf:
-            # determine if you can use an in there
-            if val % mpf(str(1.0)) == mpf(str(0.0)):
+            # test integrality on the exact mpf, a value that is not whole
+            # can still round to a whole double and must stay a float
+            if val % _MPF_ONE == _MPF_ZERO:
                 changes[name] = int(val)
             else:
                 changes[name] = float(val)
@@ -304,84 +360,107 @@ def record_change(changes: Dict, name: str, val: T, default_val: S) -> T:
     return val
 
 
-@typechecked
-def _reduced_text_sizes(text_sizes: List[Union[int, float]]):
-    """Returns a copy of text sizes with right zeroes stripped.
+@lru_cache(maxsize=1024)
+def _reduced_text_sizes_length(text_sizes: Tuple[Union[int, float], ...]) -> int:
+    """Returns the length of text sizes with right zeroes stripped.
+
+    Cached since most keys share the same text sizes. Only the length is
+    cached, as 1 and 1.0 share a cache entry, so callers slice their own sizes.
+
+    :param text_sizes: the text sizes
+    :type text_sizes: Tuple[Union[int, float], ...]
+    :return: the length without the right zeroes
+    :rtype: int
+    """
+    end = len(text_sizes)
+    while end > 0 and text_sizes[end - 1] == 0:
+        end -= 1
+    return end
+
+
+def _joined_labels(items: List[str]) -> str:
+    """Joins aligned label items by newline, right whitespace stripped.
 
-    :param arr: [description]
-    :type arr: List[Union[int, float]]
-    :return: [description]
-    :rtype: [type]
+    Trailing empty items are skipped before joining instead of stripped after.
+
+    :param items: the aligned label items
+    :type items: List[str]
+    :return: the joined label items
+    :rtype: str
     """
-    text_sizes: List[Union[int, float]] = deepcopy(text_sizes)
-    while len(text_sizes) > 0 and text_sizes[-1] == 0:
-        text_sizes.pop()
-    return text_sizes
+    end = len(items)
+    while end > 0 and items[end - 1] == "":
+        end -= 1
+    joined = "\n".join(items[:end])
+    # same as rstrip on the full join when the last item ends in whitespace
+    if joined and joined[-1].isspace():
+        return joined.rstrip()
+    return joined
 
 
-@typechecked
 def _aligned_key_properties(
     key: Key,
-    current_labels_size: List[Union[int, float]],
-) -> Tuple[int, List[str], List[str], List[Union[int, float]]]:
+    current_labels_size: Sequence[Union[int, float]],
+) -> Tuple[int, List[str], List[str], Sequence[Union[int, float]]]:
     """More space efficient text labels, text colors, text sizes.
 
     :param key: the key to compute the reorder of
     :type key: Key
-    :param current: the current key to compare to
-    :type current: Key
-    :return: a return dict with reordered version of props stored
-    :rtype: Dict
+    :param current_labels_size: the current labels' sizes to compare to
+    :type current_labels_size: Sequence[Union[int, float]]
+    :return: alignment, aligned labels, aligned colors, aligned sizes
+    :rtype: Tuple[int, List[str], List[str], Sequence[Union[int, float]]]
     """
+    default_text_color = key.default_text_color
+    default_text_size = key.default_text_size
     # size and colors if match default changed to base values
-    key_labels_size = [label.size for label in key.labels]
-    key_labels_color = [label.color for label in key.labels]
-    for i, label in enumerate(key.labels):
-        if label.text == "":
-            key_labels_color[i] = ""
-            key_labels_size[i] = 0
-        if label.color == key.default_text_color:
-            key_labels_color[i] = ""
-        if label.size == key.default_text_size:
-            key_labels_size[i] = 0
-
-    texts: List[str] = [label.text for label in key.labels]
-    colors: List[str] = [color for color in key_labels_color]
-    sizes: List[Union[int, float]] = [size for size in key_labels_size]
+    texts: List[str] = []
+    colors: List[str] = []
+    sizes: List[Union[int, float]] = []
+    for label in key.labels:
+        text = label.text
+        texts.append(text)
+        if text == "":
+            colors.append("")
+            sizes.append(0)
+            continue
+        color = label.color
+        colors.append("" if color == default_text_color else color)
+        size = label.size
+        sizes.append(0 if size == default_text_size else size)
     alignments: List[int] = [7, 5, 6, 4, 3, 1, 2, 0]
 
     # remove impossible flag combinations
     for i in range(len(texts)):
         if texts[i] != "":
-            try:
-                for alignment in deepcopy(alignments):
-                    if alignment in disallowed_alignnment_for_labels[i]:
-                        alignments.remove(alignment)
-            except ValueError:
-                pass
+            alignments = [
+                alignment
+                for alignment in alignments
+                if alignment not in disallowed_alignment_sets_for_labels[i]
+            ]
 
     # generate label arrays in correct order
     alignment = alignments[0]
-    aligned_text_labels = ["" for i in range(12)]
-    aligned_text_color = ["" for i in range(12)]
-    aligned_text_size = [0 for i in range(12)]
+    aligned_text_labels = [""] * 12
+    aligned_text_color = [""] * 12
+    aligned_text_size = [0] * 12
+    aligned_positions = inverse_label_map[alignment]
     for i in range(12):
-        if i not in label_map[alignment]:
+        ndx = aligned_positions[i]
+        if ndx < 0:
             continue
-        ndx = label_map[alignment].index(i)
-        if ndx >= 0:
-            if texts[i] != "":
-                aligned_text_labels[ndx] = texts[i]
-            if colors[i] != "":
-                aligned_text_color[ndx] = colors[i]
-            if sizes[i] != 0:
-                aligned_text_size[ndx] = sizes[i]
+        if texts[i] != "":
+            aligned_text_labels[ndx] = texts[i]
+        if colors[i] != "":
+            aligned_text_color[ndx] = colors[i]
+        if sizes[i] != 0:
+            aligned_text_size[ndx] = sizes[i]
     # clean up
-    for i in range(len(_reduced_text_sizes(aligned_text_size))):
+    for i in range(_reduced_text_sizes_length(tuple(aligned_text_size))):
         if aligned_text_labels[i] == "":
             aligned_text_size[i] = current_labels_size[i]
-        if aligned_text_size == key.default_text_size:
-            aligned_text_size[i] = 0
+    if not any(aligned_text_size):
+        aligned_text_size = _ZERO_TEXT_SIZES
 
     return (
         alignment,
@@ -430,7 +509,6 @@ class Keyboard:
         self.__metadata = metadata
 
     @property
-    @typechecked
     def keys(self) -> List[Key]:
         """Gets key references.
 
@@ -480,25 +558,28 @@ class Keyboard:
         # tracks the key with accumulated changes
         current: Key = Key()
         # allows for non-KLE defaults for label initializer
-        current_labels_size = [0 for label in current.labels]
-        current_labels_color = ["" for label in current.labels]
+        current_labels_size = [0] * len(current.labels)
+        current_labels_color = [""] * len(current.labels)
         # tmp variables to construct final labels
         alignment: int = 4
+        # buffers reused across keys for the unaligned label texts and sizes
+        blank_labels_text = ("",) * 12
+        blank_labels_size = (0,) * 12
+        labels_text: List[str] = list(blank_labels_text)
+        labels_size: List[Union[int, float]] = list(blank_labels_size)
         # keys are row separated by clusters
         # track rotation info for reset x/y positions
-        cluster_rotation_x: mpf = mpf(str(0.0))
-        cluster_rotation_y: mpf = mpf(str(0.0))
+        cluster_rotation_x: mpf = _MPF_ZERO
+        cluster_rotation_y: mpf = _MPF_ZERO
 
         # for object in list
-        for r in range(len(keyboard_json)):
-            if type(keyboard_json[r]) is list:
+        for r, row in enumerate(keyboard_json):
+            row_type = type(row)
+            if row_type is list:
                 # for item in list
-                for k in range(len(keyboard_json[r])):
-                    item: Union[str, dict] = cast(
-                        Union[str, dict],
-                        keyboard_json[r][k],
-                    )
-                    if type(item) is str:
+                for k, item in enumerate(row):
+                    item_type = type(item)
+                    if item_type is str:
                         labels: str = item
                         # create copy of key data
                         new_key: Key = deepcopy(current)
@@ -510,49 +591,46 @@ class Keyboard:
                             new_key.height2 = current.height2
                         else:
                             new_key.height2 = current.height
-                        for i, text in enumerate(
-                            unaligned(
-                                labels.split("\n"),
-                                alignment,
-                                "",
-                            )
-                        ):
-                            new_key.labels[i].text = text
-
-                        for i, size in enumerate(
-                            unaligned(
-                                current_labels_size,
-                                alignment,
-                                0,
-                            )
-                        ):
+                        # realign into the reused buffers, same as unaligned()
+                        positions = label_map[alignment]
+                        labels_text[:] = blank_labels_text
+                        for i, text in enumerate(labels.split("\n")):
+                            labels_text[positions[i]] = text
+                        labels_size[:] = blank_labels_size
+                        for i, size in enumerate(current_labels_size):
+                            labels_size[positions[i]] = size
+                        default_text_size = new_key.default_text_size
+                        default_text_color = new_key.default_text_color
+                        # fill text, size, and color of each label in one pass
+                        for i, label in enumerate(new_key.labels):
+                            label.text = labels_text[i]
+                            size = labels_size[i]
                             if size == 0:
-                                new_key.labels[i].size = new_key.default_text_size
+                                label.size = default_text_size
                             else:
-                                new_key.labels[i].size = size
-
-                        for i, color in enumerate(current_labels_color):
+                                label.size = size
+                            color = current_labels_color[i]
                             if color == "":
-                                new_key.labels[i].color = new_key.default_text_color
+                                label.color = default_text_color
                             else:
-                                new_key.labels[i].color = color
+                                label.color = color
 
                         # add key
                         keyboard.keys.append(new_key)
 
                         # adjustments for the next key
-                        current.x = current.x + mpf(current.width)
-                        current.width = mpf(str(1.0))
-                        current.height = mpf(str(1.0))
-                        current.x2 = mpf(str(0.0))
-                        current.y2 = mpf(str(0.0))
-                        current.width2 = mpf(str(0.0))
-                        current.height2 = mpf(str(0.0))
+                        current.x = current.x + current.width
+                        current.width = _MPF_ONE
+                        current.height = _MPF_ONE
+                        current.x2 = _MPF_ZERO
+                        current.y2 = _MPF_ZERO
+                        current.width2 = _MPF_ZERO
+                        current.height2 = _MPF_ZERO
                         current.is_homing = False
                         current.is_stepped = False
                         current.is_decal = False
 
-                    elif type(item) is dict:
+                    elif item_type is dict:
                         key_changes = item
                         if k != 0 and (
                             "r" in key_changes
@@ -565,7 +643,7 @@ class Keyboard:
                             )
                             raise DeserializeException(
                                 message=message,
-                                payload=keyboard_json[r],
+                                payload=row,
                             )
                         # rotation changes can only be specified at beginning
                         # at the start of the row
@@ -593,22 +671,21 @@ class Keyboard:
                             message=message,
                             payload=item,
                         )
-                current.y = current.y + mpf(str(1.0))
-            elif type(keyboard_json[r]) is dict:
-                metadata_changes = keyboard_json[r]
+                current.y = current.y + _MPF_ONE
+            elif row_type is dict:
+                metadata_changes = row
                 if r != 0:
                     raise DeserializeException(
                         "metadata can only be specified as first item",
-                        keyboard_json[r],
+                        row,
                     )
                 playback_metadata_changes(keyboard.metadata, metadata_changes)
             else:
-                message = (
-                    "encountered unexpected type of "
-                    f"{type(keyboard_json[r]).__name__}"
+                raise DeserializeException(
+                    f"encountered unexpected type of {row_type.__name__}",
+                    row,
                 )
-                raise DeserializeException(message=message, payload=keyboard_json[r])
-            current.x = mpf(str(current.rotation_x))
+            current.x = current.rotation_x
         return keyboard
 
     @with_precision(kle_precision)
@@ -620,38 +697,42 @@ class Keyboard:
         :return: the KLE formatted json
         :rtype: List[Union[Dict, List[Union[str, Dict]]]]
         """
+        # called many times per key, bound locally to skip the global lookup
+        record = record_change
         keyboard_json: Keyboard_JSON = list()
         row: List[Union[str, Dict]] = list()
         current: Key = Key()
         align: int = 4
         current_labels_color: List[str] = current.default_text_color
+        # aligned colors that current_labels_color was serialized from
+        current_aligned_text_color: List[str] = [current_labels_color] + [""] * 11
         # allows for non-KLE defaults for label initializer, can maintain value invariants
-        current_labels_size: List[Union[int, float]] = [0 for label in current.labels]
-        cluster_rotation_angle: mpf = mpf(str(0.0))
-        cluster_rotation_x: mpf = mpf(str(0.0))
-        cluster_rotation_y: mpf = mpf(str(0.0))
+        current_labels_size: Sequence[Union[int, float]] = _ZERO_TEXT_SIZES
+        cluster_rotation_angle: mpf = _MPF_ZERO
+        cluster_rotation_x: mpf = _MPF_ZERO
+        cluster_rotation_y: mpf = _MPF_ZERO
 
         metadata_changes: Dict = dict()
         default_metadata: Metadata = Metadata()
-        record_change(
+        record(
             metadata_changes,
             "backcolor",
             self.metadata.background_color,
             default_metadata.background_color,
         )
-        record_change(
+        record(
             metadata_changes,
             "name",
             self.metadata.name,
             default_metadata.name,
         )
-        record_change(
+        record(
             metadata_changes,
             "author",
             self.metadata.author,
             default_metadata.author,
         )
-        record_change(
+        record(
             metadata_changes,
             "notes",
             self.metadata.notes,
@@ -659,45 +740,45 @@ class Keyboard:
         )
         background_changes: Dict = dict()
         default_background: Background = Background()
-        record_change(
+        record(
             background_changes,
             "name",
             self.metadata.background.name,
             default_background.name,
         )
-        record_change(
+        record(
             background_changes,
             "style",
             self.__metadata.background.style,
             default_background.style,
         )
         if len(background_changes) > 0:
-            record_change(metadata_changes, "background", background_changes, None)
-        record_change(
+            record(metadata_changes, "background", background_changes, None)
+        record(
             metadata_changes,
             "radii",
             self.metadata.radii,
             default_metadata.radii,
         )
-        record_change(
+        record(
             metadata_changes,
             "switchMount",
             self.metadata.switch.mount,
             default_metadata.switch.mount,
         )
-        record_change(
+        record(
             metadata_changes,
             "switchBrand",
             self.metadata.switch.brand,
             default_metadata.switch.brand,
         )
-        record_change(
+        record(
             metadata_changes,
             "switchType",
             self.metadata.switch.type,
             default_metadata.switch.type,
         )
-        record_change(
+        record(
             metadata_changes,
             "css",
             self.metadata.css,
@@ -707,7 +788,7 @@ class Keyboard:
             self.metadata.is_switches_plate_mounted
             != default_metadata.is_switches_plate_mounted
         ):
-            record_change(
+            record(
                 metadata_changes,
                 "plate",
                 self.metadata.is_switches_plate_mounted,
@@ -717,7 +798,7 @@ class Keyboard:
             self.metadata.is_switches_pcb_mounted
             != default_metadata.is_switches_pcb_mounted
         ):
-            record_change(
+            record(
                 metadata_changes,
                 "pcb",
                 self.metadata.is_switches_pcb_mounted,
@@ -728,9 +809,9 @@ class Keyboard:
 
         is_new_row: bool = True
         # will be incremented on first row
-        current.y = current.y - mpf(str(1.0))
+        current.y = current.y - _MPF_ONE
 
-        sorted_keys: List[Key] = list(sorted(self.__keys, key=key_sort_criteria))
+        sorted_keys: List[Key] = sorted(self.__keys, key=key_sort_criteria)
         for key in sorted_keys:
             key_changes = dict()
             (
@@ -750,14 +831,14 @@ class Keyboard:
                 or (key.rotation_y != cluster_rotation_y)
             )
             is_row_changed: bool = key.y != current.y
-            if len(row) > 0 and (is_row_changed or is_cluster_changed):
+            if row and (is_row_changed or is_cluster_changed):
                 # set up for the new row
                 keyboard_json.append(row)
                 row = list()
                 is_new_row = True
 
             if is_new_row:
-                current.y = current.y + mpf(str(1.0))
+                current.y = current.y + _MPF_ONE
 
                 # set up for the new row
                 # y is reset if either rx or ry are changed
@@ -776,41 +857,41 @@ class Keyboard:
 
                 is_new_row = False
 
-            current.rotation_angle = record_change(
+            current.rotation_angle = record(
                 key_changes,
                 "r",
                 key.rotation_angle,
                 current.rotation_angle,
             )
-            current.rotation_x = record_change(
+            current.rotation_x = record(
                 key_changes,
                 "rx",
                 key.rotation_x,
                 current.rotation_x,
             )
-            current.rotation_y = record_change(
+            current.rotation_y = record(
                 key_changes,
                 "ry",
                 key.rotation_y,
                 current.rotation_y,
             )
-            current.y = current.y + record_change(
+            current.y = current.y + record(
                 key_changes,
                 "y",
                 key.y - current.y,
-                mpf(str(0.0)),
+                _MPF_ZERO,
             )
             current.x = (
                 current.x
-                + record_change(
+                + record(
                     key_changes,
                     "x",
                     key.x - current.x,
-                    mpf(str(0.0)),
+                    _MPF_ZERO,
                 )
                 + key.width
             )
-            current.color = record_change(
+            current.color = record(
                 key_changes,
                 "c",
                 key.color,
@@ -826,100 +907,100 @@ class Keyboard:
                         and aligned_text_color[i] != aligned_text_color[0]
                     ):
                         aligned_text_color[i] = key.default_text_color
-            current_labels_color = record_change(
-                key_changes,
-                "t",
-                "\n".join(aligned_text_color).rstrip(),
-                current_labels_color,
-            )
-            current.is_ghosted = record_change(
+            # same colors serialize the same, only join when they differ
+            if aligned_text_color != current_aligned_text_color:
+                current_labels_color = record(
+                    key_changes,
+                    "t",
+                    _joined_labels(aligned_text_color),
+                    current_labels_color,
+                )
+                current_aligned_text_color = aligned_text_color
+            current.is_ghosted = record(
                 key_changes,
                 "g",
                 key.is_ghosted,
                 current.is_ghosted,
             )
-            current.profile_and_row = record_change(
+            current.profile_and_row = record(
                 key_changes,
                 "p",
                 key.profile_and_row,
                 current.profile_and_row,
             )
-            current.switch.mount = record_change(
+            current.switch.mount = record(
                 key_changes,
                 "sm",
                 key.switch.mount,
                 current.switch.mount,
             )
-            current.switch.brand = record_change(
+            current.switch.brand = record(
                 key_changes,
                 "sb",
                 key.switch.brand,
                 current.switch.brand,
             )
-            current.switch.type = record_change(
+            current.switch.type = record(
                 key_changes,
                 "st",
                 key.switch.type,
                 current.switch.type,
             )
-            align = record_change(
+            align = record(
                 key_changes,
                 "a",
                 alignment,
                 align,
             )
-            current.default_text_size = record_change(
+            current.default_text_size = record(
                 key_changes,
                 "f",
                 key.default_text_size,
                 current.default_text_size,
             )
             if "f" in key_changes:
-                current_labels_size = [0 for i in range(12)]
+                current_labels_size = _ZERO_TEXT_SIZES
             # if text sizes arent already optimized, optimize it
             if not compare_text_sizes(
                 current_labels_size, aligned_text_size, aligned_text_labels
             ):
-                if len(_reduced_text_sizes(aligned_text_size)) == 0:
+                reduced_text_size = aligned_text_size[
+                    : _reduced_text_sizes_length(tuple(aligned_text_size))
+                ]
+                if len(reduced_text_size) == 0:
                     # force f to be written
-                    record_change(
+                    record(
                         key_changes,
                         "f",
                         key.default_text_size,
                         -1,
                     )
                 else:
-                    optimizeF2: bool = not bool(aligned_text_size[0])
-                    for i in range(2, len(_reduced_text_sizes(aligned_text_size))):
-                        if not optimizeF2:
-                            break
-                        optimizeF2 = aligned_text_size[i] == aligned_text_size[1]
+                    # f2 applies when all but the first size are equal
+                    f2: Union[int, float] = aligned_text_size[1]
+                    optimizeF2: bool = not aligned_text_size[0] and all(
+                        size == f2 for size in reduced_text_size[2:]
+                    )
                     if optimizeF2:
-                        f2: Union[int, float] = aligned_text_size[1]
                         # current.f2 not ever used
                         # removed current.f2 = serializeProp(props, "f2", f2, -1);
-                        record_change(key_changes, "f2", f2, -1)
-                        current_labels_size = [0] + [f2 for i in range(11)]
+                        record(key_changes, "f2", f2, -1)
+                        current_labels_size = [0] + [f2] * 11
                     else:
                         current_labels_size = aligned_text_size
-                        record_change(
+                        record(
                             key_changes,
                             "fa",
-                            _reduced_text_sizes(aligned_text_size),
+                            reduced_text_size,
                             [],
                         )
-            record_change(key_changes, "w", key.width, mpf(str(1.0)))
-            record_change(key_changes, "h", key.height, mpf(str(1.0)))
-            record_change(key_changes, "w2", key.width2, key.width)
-            record_change(key_changes, "h2", key.height2, key.height)
-            record_change(key_changes, "x2", key.x2, mpf(str(0.0)))
-            record_change(key_changes, "y2", key.y2, mpf(str(0.0)))
-            record_change(key_changes, "n", key.is_homing, False)
-            record_change(key_changes, "l", key.is_stepped, False)
-            record_change(key_changes, "d", key.is_decal, False)
-            if len(key_changes) > 0:
+            for name, attribute, default_val in key_change_defaults:
+                if callable(default_val):
+                    default_val = default_val(key)
+                record(key_changes, name, getattr(key, attribute), default_val)
+            if key_changes:
                 row.append(key_changes)
-            row.append("\n".join(aligned_text_labels).rstrip())
-        if len(row) > 0:
+            row.append(_joined_labels(aligned_text_labels))
+        if row:
             keyboard_json.append(row)
         return keyboard_json
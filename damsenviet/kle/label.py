@@ -1,8 +1,12 @@
 from __future__ import annotations
-from typing import Union
+from typing import (
+    Union,
+    Dict,
+)
 from typeguard import typechecked
 from .utils import (
     autorepr,
+    copy_fields,
     expect,
     is_valid_css_color,
 )
@@ -37,6 +41,9 @@ class Label:
             },
         )
 
+    def __deepcopy__(self, memo: Dict) -> Label:
+        return copy_fields(self, memo)
+
     @property
     def text(self) -> str:
         """Gets text content.
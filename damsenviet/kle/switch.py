@@ -1,6 +1,9 @@
+from __future__ import annotations
+from typing import Dict
 from typeguard import typechecked
 from .utils import (
     autorepr,
+    copy_fields,
     expect,
 )
 
@@ -433,6 +436,9 @@ class Switch:
             },
         )
 
+    def __deepcopy__(self, memo: Dict) -> Switch:
+        return copy_fields(self, memo)
+
     @property
     def mount(self) -> str:
         """Gets switch mount.
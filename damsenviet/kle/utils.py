@@ -19,9 +19,12 @@ from tinycss2.ast import (
     WhitespaceToken,
     ParseError,
 )
-from mpmath import mp
+from mpmath import (
+    mp,
+    mpf,
+)
+from mpmath.libmp import dps_to_prec
 from tinycss2.parser import parse_one_declaration
-from typeguard import typechecked
 from .exceptions import IllegalValueException
 
 __all__ = [""]
@@ -31,19 +34,39 @@ S = TypeVar("S")
 
 
 def autorepr(self: Any, attributes: Dict[str, Any]):
-    key_eq_val_strs: List[str] = []
-    for key, value in attributes.items():
-        key_eq_val_strs.append(f"{key}={repr(value)}")
-    serial: str = ", ".join(key_eq_val_strs)
+    serial: str = ", ".join(f"{key}={repr(value)}" for key, value in attributes.items())
     return f"{self.__class__.__name__}({serial})"
 
 
+def copy_fields(self: T, memo: Dict[int, Any]) -> T:
+    """Copies an object by sharing its fields, skipping __init__ and the setters.
+
+    Fields are shared rather than copied, callers replace any mutable ones.
+
+    :param self: the object to copy
+    :type self: T
+    :param memo: the deepcopy memo
+    :type memo: Dict[int, Any]
+    :return: the copy
+    :rtype: T
+    """
+    copy = self.__class__.__new__(self.__class__)
+    memo[id(self)] = copy
+    copy.__dict__.update(self.__dict__)
+    return copy
+
+
+# exact at any precision, safe to share since mpf is immutable
+_MPF_ZERO = mpf(0)
+_MPF_ONE = mpf(1)
+_MPF_360 = mpf(360)
+
+
 # number of decimal places to keep
 # https://developer.mozilla.org/en-US/docs/Web/JavaScript/Reference/Global_Objects/Number
 kle_precision = 17
 
 
-@typechecked
 def with_precision(precision: int):
     """Temporarily modifies the precision of mpmath.
 
@@ -53,16 +76,28 @@ def with_precision(precision: int):
     :rtype: Callable
     """
 
+    expect(
+        "precision",
+        precision,
+        "be an int",
+        lambda precision: isinstance(precision, int),
+    )
+    # mp.dps is decimal significant places
+    # mp.prec is the number of precision bits, convert once here
+    precision_bits = dps_to_prec(precision)
+
     def decorator(function):
         @wraps(function)
         def wrapped(*args, **kwargs):
-            # mp.dps is decimal significant places
-            # mp.prec is the number of precision bits
-            old_precision = mp.dps
-            mp.dps = precision
-            result = function(*args, **kwargs)
-            mp.dps = old_precision
-            return result
+            old_precision_bits = mp.prec
+            # already in precision, e.g. nested calls, nothing to swap
+            if old_precision_bits == precision_bits:
+                return function(*args, **kwargs)
+            mp.prec = precision_bits
+            try:
+                return function(*args, **kwargs)
+            finally:
+                mp.prec = old_precision_bits
 
         return wrapped
 
@@ -88,9 +123,11 @@ def expect(
     :return: None
     :rtype: None
     """
-    message = f"expected {value_name} {repr(value)} to {condition_description}"
     if not condition(value):
-        raise IllegalValueException(message, value)
+        raise IllegalValueException(
+            f"expected {value_name} {repr(value)} to {condition_description}",
+            value,
+        )
 
 
 def is_valid_css_stylesheet(css: str) -> bool:
@@ -0,0 +1,102 @@
+import gc
+import sys
+import pytest
+import damsenviet.kle as kle
+from damsenviet.kle import exceptions
+
+
+def test_acquire_reuses_released_exception():
+    exceptions._exception_pool.clear()
+    exception = kle.DeserializeException.acquire("first", payload=[1])
+    kle.DeserializeException.release(exception)
+    reused = kle.DeserializeException.acquire("second", payload=[2])
+    assert reused is exception
+    assert str(reused) == "second"
+    assert reused.payload == [2]
+
+
+def test_acquire_without_released_exception():
+    exceptions._exception_pool.clear()
+    exception = kle.DeserializeException.acquire("message")
+    assert str(exception) == "message"
+    assert exception.payload is None
+
+
+def test_release_twice_does_not_share_exception():
+    exceptions._exception_pool.clear()
+    exception = kle.DeserializeException.acquire("message")
+    kle.DeserializeException.release(exception)
+    kle.DeserializeException.release(exception)
+    first = kle.DeserializeException.acquire("first")
+    second = kle.DeserializeException.acquire("second")
+    assert first is not second
+
+
+def test_release_clears_previous_error_state():
+    exceptions._exception_pool.clear()
+    try:
+        try:
+            raise ValueError("cause")
+        except ValueError as cause:
+            raise kle.DeserializeException("message", [1]) from cause
+    except kle.DeserializeException as exception:
+        kle.DeserializeException.release(exception)
+    reused = kle.DeserializeException.acquire("other")
+    assert reused.__traceback__ is None
+    assert reused.__cause__ is None
+    assert reused.__context__ is None
+    assert not reused.__suppress_context__
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="add_note requires 3.11")
+def test_release_clears_notes():
+    exceptions._exception_pool.clear()
+    exception = kle.DeserializeException("message", None)
+    exception.add_note("note")
+    kle.DeserializeException.release(exception)
+    reused = kle.DeserializeException.acquire("other")
+    assert not hasattr(reused, "__notes__")
+
+
+def test_release_does_not_create_instance_dict():
+    exceptions._exception_pool.clear()
+    exception = kle.DeserializeException("message", None)
+    kle.DeserializeException.release(exception)
+    assert not any(
+        isinstance(referent, dict) for referent in gc.get_referents(exception)
+    )
+
+
+def test_lazy_formats_message_on_first_use():
+    exception = kle.DeserializeException.lazy(
+        "encountered unexpected type of {}", "int", payload=5
+    )
+    assert exception.payload == 5
+    assert exception.args == ("encountered unexpected type of int",)
+    assert str(exception) == "encountered unexpected type of int"
+
+
+def test_lazy_formats_template_without_arguments():
+    exception = kle.DeserializeException.lazy("literal {{braces}}")
+    assert str(exception) == "literal {braces}"
+    assert exception.args == ("literal {braces}",)
+
+
+def test_eager_message_is_not_formatted():
+    exception = kle.DeserializeException("literal {braces}", None)
+    assert str(exception) == "literal {braces}"
+
+
+def test_lazy_repr_is_stable():
+    exception = kle.DeserializeException.lazy("expected {} got {}", "a", "b")
+    rendered = repr(exception)
+    assert rendered == "DeserializeException('expected a got b')"
+    str(exception)
+    assert repr(exception) == rendered
+
+
+def test_unexpected_type_message():
+    with pytest.raises(kle.DeserializeException) as exception_info:
+        kle.Keyboard.from_json([5])
+    assert exception_info.value.args == ("encountered unexpected type of int",)
+    assert exception_info.value.payload == 5
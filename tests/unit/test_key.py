@@ -0,0 +1,22 @@
+from copy import deepcopy
+from mpmath import mpf
+from damsenviet.kle import Key
+
+
+def test_deepcopy_copies_labels_and_switch():
+    key = Key()
+    key.x = mpf(2)
+    key.labels[0].text = "a"
+    key.switch.mount = "cherry"
+    copy = deepcopy(key)
+    assert copy is not key
+    assert copy.x == key.x
+    assert copy.labels[0].text == "a"
+    assert copy.switch.mount == "cherry"
+    assert copy.labels is not key.labels
+    assert all(copied is not label for copied, label in zip(copy.labels, key.labels))
+    assert copy.switch is not key.switch
+    copy.labels[0].text = "b"
+    copy.switch.mount = "alps"
+    assert key.labels[0].text == "a"
+    assert key.switch.mount == "cherry"
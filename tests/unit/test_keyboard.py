@@ -0,0 +1,20 @@
+from mpmath import mp, mpf
+from damsenviet.kle.keyboard import record_change
+from damsenviet.kle.utils import kle_precision
+
+
+def test_record_change_emits_whole_mpf_as_int():
+    changes = {}
+    record_change(changes, "y", mpf(3), mpf(0))
+    assert changes == {"y": 3}
+    assert type(changes["y"]) is int
+
+
+def test_record_change_keeps_nearly_whole_mpf_as_float():
+    changes = {}
+    with mp.workdps(kle_precision):
+        # not whole, but rounds to a whole double
+        value = mpf(3) + mpf(2) ** -55
+        record_change(changes, "y", value, mpf(0))
+    assert type(changes["y"]) is float
+    assert changes["y"] == 3.0
@@ -0,0 +1,9 @@
+import pytest
+from damsenviet.kle.exceptions import IllegalValueException
+from damsenviet.kle.utils import with_precision
+
+
+@pytest.mark.parametrize("precision", ["17", 17.9, None])
+def test_with_precision_rejects_non_int(precision):
+    with pytest.raises(IllegalValueException):
+        with_precision(precision)